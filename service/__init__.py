@@ -25,6 +25,8 @@ import sys
 from flask import Flask
 from service import config
 from service.common import log_handlers
+from service.common.http_client import init_http_client
+from service.common.json_provider import OrjsonProvider
 
 # NOTE: Do not change the order of this code
 # The Flask app must be created
@@ -33,6 +35,11 @@ from service.common import log_handlers
 # Create the Flask aoo
 app = Flask(__name__)  # pylint: disable=invalid-name
 
+# Use orjson to serialize all JSON responses
+# orjson output is compact; also keep keys in insertion order
+app.json = OrjsonProvider(app)
+app.json.sort_keys = False
+
 # Load Configurations
 app.config.from_object(config)
 
@@ -44,6 +51,10 @@ from service.common import error_handlers, cli_commands  # noqa: F401, E402
 # Set up logging for production
 log_handlers.init_logging(app, "gunicorn.error")
 
+# Share one pooled HTTP session for outbound calls
+# use current_app.extensions["http"] in request handlers
+init_http_client(app)
+
 app.logger.info(70 * "*")
 app.logger.info("  P E T   S E R V I C E   R U N N I N G  ".center(70, "*"))
 app.logger.info(70 * "*")
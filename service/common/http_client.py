@@ -0,0 +1,40 @@
+######################################################################
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+"""
+HTTP Client
+
+This module contains utility functions to set up a shared HTTP
+session so outbound calls reuse pooled connections
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def init_http_client(app) -> requests.Session:
+    """Creates the application's HTTP session and stores it in app.extensions["http"]"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=app.config["HTTP_POOL_CONNECTIONS"],
+        pool_maxsize=app.config["HTTP_POOL_MAXSIZE"],
+        max_retries=Retry(total=app.config["HTTP_MAX_RETRIES"], backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    app.extensions["http"] = session
+    app.logger.info("HTTP client established")
+    return session
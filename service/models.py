@@ -30,9 +30,13 @@ available (boolean) - True for products that are available for adoption
 """
 import logging
 from enum import Enum
+from operator import attrgetter
 from decimal import Decimal
+import orjson
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.orm import reconstructor
 
 logger = logging.getLogger("flask.app")
 
@@ -45,6 +49,10 @@ def init_db(app):
     Product.init_db(app)
 
 
+# Reads every serialized column of a Product in a single call
+_SERIALIZED_FIELDS = attrgetter("id", "name", "description", "price", "available", "category")
+
+
 class DataValidationError(Exception):
     """Used for an data validation errors when deserializing"""
 
@@ -72,18 +80,34 @@ class Product(db.Model):
     # Table Schema
     ##################################################
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.String(250), nullable=False)
-    price = db.Column(db.Numeric, nullable=False)
-    available = db.Column(db.Boolean(), nullable=False, default=True)
+    price = db.Column(db.Numeric, nullable=False, index=True)
+    available = db.Column(db.Boolean(), nullable=False, default=True, index=True)
     category = db.Column(
         db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name)
     )
 
+    # Serves category lookups, alone or combined with availability
+    __table_args__ = (db.Index("ix_product_category_available", "category", "available"),)
+
+    # JSON encoding of serialize(), built on first use by serialize_bytes()
+    _json_cache = None
+
     ##################################################
     # INSTANCE METHODS
     ##################################################
 
+    @reconstructor
+    def clear_json_cache(self, *_args):
+        """Drops the cached JSON encoding of this Product
+
+        Called when the Product is loaded, created or updated, when
+        its attributes are expired or refreshed, and whenever one of
+        its columns is set
+        """
+        self._json_cache = None
+
     def __repr__(self):
         return f"<Product {self.name} id=[{self.id}]>"
 
@@ -94,6 +118,7 @@ class Product(db.Model):
         logger.info("Creating %s", self.name)
         # id must be none to generate next primary key
         self.id = None  # pylint: disable=invalid-name
+        self.clear_json_cache()
         db.session.add(self)
         db.session.commit()
 
@@ -104,6 +129,7 @@ class Product(db.Model):
         logger.info("Saving %s", self.name)
         if not self.id:
             raise DataValidationError("Update called with empty ID field")
+        self.clear_json_cache()
         db.session.commit()
 
     def delete(self):
@@ -114,15 +140,26 @@ class Product(db.Model):
 
     def serialize(self) -> dict:
         """Serializes a Product into a dictionary"""
+        product_id, name, description, price, available, category = _SERIALIZED_FIELDS(self)
         return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "price": str(self.price),
-            "available": self.available,
-            "category": self.category.name  # convert enum to string
+            "id": product_id,
+            "name": name,
+            "description": description,
+            "price": str(price),
+            "available": available,
+            "category": category.name  # convert enum to string
         }
 
+    def serialize_bytes(self) -> bytes:
+        """Serializes a Product into JSON bytes
+
+        The encoding is cached on this instance until one of its
+        columns changes
+        """
+        if self._json_cache is None:
+            self._json_cache = orjson.dumps(self.serialize())
+        return self._json_cache
+
     def deserialize(self, data: dict):
         """
         Deserializes a Product from a dictionary
@@ -189,6 +226,22 @@ class Product(db.Model):
         logger.info("Processing lookup for id %s ...", product_id)
         return cls.query.get(product_id)
 
+    @classmethod
+    def delete_by_id(cls, product_id: int) -> int:
+        """Removes a Product from the data store by it's ID
+
+        :param product_id: the id of the Product to delete
+        :type product_id: int
+
+        :return: the number of Products deleted
+        :rtype: int
+
+        """
+        logger.info("Deleting id %s ...", product_id)
+        deleted = cls.query.filter(cls.id == product_id).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
+
     @classmethod
     def find_by_name(cls, name: str) -> list:
         """Returns all Products with the given name
@@ -247,3 +300,13 @@ class Product(db.Model):
         """
         logger.info("Processing category query for %s ...", category.name)
         return cls.query.filter(cls.category == category)
+
+
+# Keep serialize_bytes() in step with direct column assignments
+for _column in (Product.id, Product.name, Product.description, Product.price,
+                Product.available, Product.category):
+    event.listen(_column, "set", Product.clear_json_cache)
+
+# and with attributes reloaded from the database, e.g. after a commit
+event.listen(Product, "expire", Product.clear_json_cache)
+event.listen(Product, "refresh", Product.clear_json_cache)
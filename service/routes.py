@@ -18,12 +18,51 @@
 """
 Product Store Service with UI
 """
-from flask import jsonify, request, abort
+import functools
+import hashlib
+import threading
+from cachetools import TTLCache
+from flask import jsonify, request, abort, Response, stream_with_context
 from flask import url_for  # noqa: F401 pylint: disable=unused-import
 from service.models import Product, Category
 from service.common import status  # HTTP Status Codes
 from . import app
 
+# Serialized JSON and ETag of recently read Products keyed by product id
+# Requests run on several gunicorn threads (see Procfile) and TTLCache
+# is not thread safe, so every access must hold the lock. The lock alone
+# does not stop a read from refilling a stale entry; see below
+product_cache = TTLCache(maxsize=10_000, ttl=600)
+product_cache_lock = threading.Lock()
+
+# Reads of product ids missing from product_cache that are in flight, and
+# how often each of those ids has been evicted since. A read only fills
+# the cache if no update or delete evicted the id while it ran. Entries
+# are dropped when the last read of an id finishes, so neither map
+# outgrows the number of concurrent requests
+_product_reads = {}
+_product_generations = {}
+
+# Largest page size list_products will return
+MAX_PER_PAGE = 1000
+
+# Product Categories by name, for the category query parameter
+_CATEGORY_BY_NAME = {category.name: category for category in Category}
+
+# Strings accepted by str_to_bool
+_BOOL_MAP = {
+    'true': True,
+    '1': True,
+    't': True,
+    'y': True,
+    'yes': True,
+    'false': False,
+    '0': False,
+    'f': False,
+    'n': False,
+    'no': False
+}
+
 
 ######################################################################
 # H E A L T H   C H E C K
@@ -48,46 +87,125 @@ def index():
 ######################################################################
 def check_content_type(content_type):
     """Checks that the media type is correct"""
-    if "Content-Type" not in request.headers:
-        app.logger.error("No Content-Type specified.")
-        abort(
-            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            f"Content-Type must be {content_type}",
-        )
-
-    if request.headers["Content-Type"] == content_type:
+    if request.mimetype == content_type:
         return
 
-    app.logger.error("Invalid Content-Type: %s", request.headers["Content-Type"])
+    app.logger.error("Invalid Content-Type: %s", request.mimetype or "none specified")
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         f"Content-Type must be {content_type}",
     )
 
 
+def get_positive_int_arg(name, default, maximum=None):
+    """Gets a positive integer query parameter, aborting if it is invalid"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1 or (maximum is not None and number > maximum):
+        limit = f" no greater than {maximum}" if maximum is not None else ""
+        abort(
+            status.HTTP_400_BAD_REQUEST,
+            f"{name} must be a positive integer{limit}",
+        )
+    return number
+
+
+def evict_product(product_id):
+    """Removes a Product from product_cache after it is changed"""
+    with product_cache_lock:
+        product_cache.pop(product_id, None)
+        if product_id in _product_reads:
+            _product_generations[product_id] = _product_generations.get(product_id, 0) + 1
+
+
+def read_product(product_id):
+    """Reads a Product's JSON and ETag, through product_cache"""
+    with product_cache_lock:
+        cached = product_cache.get(product_id)
+        if cached is not None:
+            return cached
+        _product_reads[product_id] = _product_reads.get(product_id, 0) + 1
+        generation = _product_generations.get(product_id, 0)
+
+    try:
+        product = Product.find(product_id)
+
+        if product is None:
+            app.logger.error("Product not found.")
+            abort(
+                status.HTTP_404_NOT_FOUND,
+                f"Product Id not found {product_id}"
+            )
+
+        message = product.serialize_bytes()
+        cached = (message, hashlib.blake2b(message, digest_size=16).hexdigest())
+        with product_cache_lock:
+            if _product_generations.get(product_id, 0) == generation:
+                product_cache[product_id] = cached
+        return cached
+    finally:
+        with product_cache_lock:
+            _product_reads[product_id] -= 1
+            if not _product_reads[product_id]:
+                del _product_reads[product_id]
+                _product_generations.pop(product_id, None)
+
+
+@functools.lru_cache(maxsize=32)
 def str_to_bool(str_value):
     """
     Map string to bool
     """
-    bool_map = {
-        'true': True,
-        '1': True,
-        't': True,
-        'y': True,
-        'yes': True,
-        'false': False,
-        '0': False,
-        'f': False,
-        'n': False,
-        'no': False
-    }
-
     try:
-        return bool_map[str_value.lower()]
+        return _BOOL_MAP[str_value.lower()]
     except KeyError as exc:
         raise ValueError(f"Cannot convert {str_value} to a boolean") from exc
 
 
+def find_by_category_name(category_name):
+    """Finds the Products in a Category given its name"""
+    category = _CATEGORY_BY_NAME.get(category_name.upper())
+    if category is None:
+        app.logger.error("Unknown category: %s", category_name)
+        abort(status.HTTP_400_BAD_REQUEST, f"Unknown category {category_name}")
+    return Product.find_by_category(category)
+
+
+def find_by_availability_str(available):
+    """Finds the Products by availability given as a string"""
+    try:
+        available_value = str_to_bool(available)
+    except ValueError as error:
+        app.logger.error("Invalid availability: %s", available)
+        abort(status.HTTP_400_BAD_REQUEST, str(error))
+    return Product.find_by_availability(available_value)
+
+
+# Query parameters that filter list_products, in order of precedence
+_FILTERS = (
+    ("name", Product.find_by_name),
+    ("category", find_by_category_name),
+    ("available", find_by_availability_str),
+)
+
+
+def filter_products():
+    """Queries the Products matching the first filter in the request args"""
+    for arg, _ in _FILTERS:
+        app.logger.info("%s=%s", arg, request.args.get(arg))
+
+    for arg, find in _FILTERS:
+        value = request.args.get(arg)
+        if value:
+            return find(value)
+    return Product.query
+
+
 ######################################################################
 # C R E A T E   A   N E W   P R O D U C T
 ######################################################################
@@ -107,10 +225,15 @@ def create_products():
     product.create()
     app.logger.info("Product with new id [%s] saved!", product.id)
 
-    message = product.serialize()
+    message = product.serialize_bytes()
 
     location_url = url_for("get_products", product_id=product.id, _external=True)
-    return jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
+    return Response(
+        message,
+        status=status.HTTP_201_CREATED,
+        headers={"Location": location_url},
+        mimetype="application/json",
+    )
 
 
 ######################################################################
@@ -122,62 +245,71 @@ def list_products():
     """
     Get all Products
     This endpoint will get all Products
+
+    Pass page and/or per_page (at most MAX_PER_PAGE) to get a single page
+    of Products, or count_only=true to get just the number of matching Products
     """
     app.logger.info("Request to Get all Products...")
 
-    name = request.args.get("name")
-    app.logger.info(f"name={name}")
-
-    category = request.args.get("category")
-    app.logger.info(f"category={category}")
-
-    available = request.args.get("available")
-    app.logger.info(f"available={available}")
+    products = filter_products()
 
-    if name:
-        products = Product.find_by_name(name)
-    elif category:
-        products = Product.find_by_category(getattr(Category, category.upper()))
-    elif available:
-        products = Product.find_by_availability(str_to_bool(available))
-    else:
-        products = Product.all()
+    # validate paging first so it is rejected even for count_only requests
+    paged = "page" in request.args or "per_page" in request.args
+    page = get_positive_int_arg("page", 1)
+    per_page = get_positive_int_arg("per_page", 50, MAX_PER_PAGE)
 
-    product_response = [product.serialize() for product in products]
-
-    return product_response, status.HTTP_200_OK
+    try:
+        count_only = str_to_bool(request.args.get("count_only", "false"))
+    except ValueError as error:
+        abort(status.HTTP_400_BAD_REQUEST, str(error))
+    if count_only:
+        return jsonify(count=products.count()), status.HTTP_200_OK
+
+    if paged:
+        products = products.order_by(Product.id).limit(per_page).offset((page - 1) * per_page)
+
+    def generate():
+        """Streams the Products as a JSON array, one at a time"""
+        yield b"["
+        first = True
+        for product in products.yield_per(500):
+            if not first:
+                yield b","
+            first = False
+            yield product.serialize_bytes()
+        yield b"]"
+
+    return Response(
+        stream_with_context(generate()),
+        status=status.HTTP_200_OK,
+        mimetype="application/json",
+    )
 
 
 ######################################################################
 # R E A D   A   P R O D U C T
 ######################################################################
 
-@app.route("/products/<product_id>", methods=["GET"])
+@app.route("/products/<int:product_id>", methods=["GET"])
 def get_products(product_id):
     """
     Get a Product
     This endpoint will get a Product by Id
     """
     app.logger.info("Request to Get a Product...")
-    product = Product.find(product_id)
-
-    if product is None:
-        app.logger.error("Product not found.")
-        abort(
-            status.HTTP_404_NOT_FOUND,
-            f"Product Id not found {product_id}"
-        )
+    message, etag = read_product(product_id)
+    response = Response(message, status=status.HTTP_200_OK, mimetype="application/json")
+    response.set_etag(etag)
 
-    message = product.serialize()
-
-    return message, status.HTTP_200_OK
+    # answers 304 Not Modified when the client already has this version
+    return response.make_conditional(request)
 
 
 ######################################################################
 # U P D A T E   A   P R O D U C T
 ######################################################################
 
-@app.route("/products/<product_id>", methods=["PUT"])
+@app.route("/products/<int:product_id>", methods=["PUT"])
 def update_products(product_id):
     """
     Update a Product
@@ -198,15 +330,18 @@ def update_products(product_id):
     product.deserialize(data)
 
     product.update()
+    evict_product(product_id)
 
-    return product.serialize(), status.HTTP_200_OK
+    return Response(
+        product.serialize_bytes(), status=status.HTTP_200_OK, mimetype="application/json"
+    )
 
 
 ######################################################################
 # D E L E T E   A   P R O D U C T
 ######################################################################
 
-@app.route("/products/<product_id>", methods=["DELETE"])
+@app.route("/products/<int:product_id>", methods=["DELETE"])
 def delete_product(product_id):
     """
     Delete a Product
@@ -214,15 +349,13 @@ def delete_product(product_id):
     """
     app.logger.info("Request to Delete a Product...")
 
-    product = Product.find(product_id)
-
-    if product is None:
+    if not Product.delete_by_id(product_id):
         app.logger.error("Product not found.")
         abort(
             status.HTTP_404_NOT_FOUND,
             f"Product Id not found {product_id}"
         )
 
-    product.delete()
+    evict_product(product_id)
 
     return "", status.HTTP_204_NO_CONTENT
@@ -0,0 +1,33 @@
+"""
+Test cases for the shared HTTP client
+"""
+from unittest import TestCase
+from unittest.mock import patch
+from flask import Flask
+from requests import Session
+from service import app, config
+from service.common.http_client import init_http_client
+
+
+class TestHttpClient(TestCase):
+    """Test the HTTP Client"""
+
+    def test_http_session(self):
+        """It should share an HTTP session on the app"""
+        self.assertIsInstance(app.extensions["http"], Session)
+
+    @patch("service.common.http_client.HTTPAdapter")
+    def test_http_session_pool(self, adapter_mock):
+        """It should pool HTTP connections as configured"""
+        test_app = Flask(__name__)
+        test_app.config.from_object(config)
+        session = init_http_client(test_app)
+        self.assertIs(test_app.extensions["http"], session)
+
+        adapter_mock.assert_called_once()
+        kwargs = adapter_mock.call_args.kwargs
+        self.assertEqual(kwargs["pool_connections"], config.HTTP_POOL_CONNECTIONS)
+        self.assertEqual(kwargs["pool_maxsize"], config.HTTP_POOL_MAXSIZE)
+        self.assertEqual(kwargs["max_retries"].total, config.HTTP_MAX_RETRIES)
+        for prefix in ("http://", "https://"):
+            self.assertIs(session.get_adapter(prefix + "example.com"), adapter_mock.return_value)
@@ -0,0 +1,47 @@
+"""
+Test cases for the orjson JSON Provider
+"""
+from decimal import Decimal
+from unittest import TestCase
+from flask import Flask
+from service.common.json_provider import OrjsonProvider
+
+
+class TestOrjsonProvider(TestCase):
+    """Test the orjson JSON Provider"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.provider = OrjsonProvider(self.app)
+
+    def test_dumps(self):
+        """It should dump compact JSON with sorted keys"""
+        self.assertEqual(self.provider.dumps({"b": 1, "a": [True, None]}), '{"a":[true,null],"b":1}')
+
+    def test_dumps_unsorted(self):
+        """It should keep insertion order when sort_keys is off"""
+        self.provider.sort_keys = False
+        self.assertEqual(self.provider.dumps({"b": 1, "a": 2}), '{"b":1,"a":2}')
+
+    def test_dumps_decimal(self):
+        """It should dump a Decimal as a string"""
+        self.assertEqual(self.provider.dumps({"price": Decimal("12.50")}), '{"price":"12.50"}')
+
+    def test_dumps_unsupported_type(self):
+        """It should not dump a type it does not support"""
+        with self.assertRaises(TypeError):
+            self.provider.dumps({"value": object()})
+
+    def test_loads(self):
+        """It should load JSON from a string or bytes"""
+        self.assertEqual(self.provider.loads('{"a": 1}'), {"a": 1})
+        self.assertEqual(self.provider.loads(b'[1, "2"]'), [1, "2"])
+
+    def test_response(self):
+        """It should wrap JSON in a Response"""
+        response = self.provider.response(price=Decimal("1.5"), name="Fedora")
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_data(), b'{"name":"Fedora","price":"1.5"}')
+
+        response = self.provider.response([1, 2])
+        self.assertEqual(response.get_data(), b"[1,2]")
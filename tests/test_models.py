@@ -24,6 +24,7 @@ While debugging just these tests it's convenient to use this:
 
 """
 import os
+import json
 import logging
 import unittest
 from decimal import Decimal
@@ -68,6 +69,16 @@ class TestProductModel(unittest.TestCase):
         """This runs after each test"""
         db.session.remove()
 
+    ######################################################################
+    #  Utility function to bulk create products
+    ######################################################################
+    def _create_products(self, count: int = 1) -> list:
+        """Saves fake products to the database in a single commit"""
+        products = [ProductFactory(id=None) for _ in range(count)]
+        db.session.add_all(products)
+        db.session.commit()
+        return products
+
     ######################################################################
     #  T E S T   C A S E S
     ######################################################################
@@ -165,25 +176,31 @@ class TestProductModel(unittest.TestCase):
         products = Product.all()
         self.assertEqual(len(products), 0)
 
+    def test_delete_a_product_by_id(self):
+        """It should Delete a Product from the database by its Id"""
+        product = ProductFactory()
+        product.id = None
+        product.create()
+        product_id = product.id
+
+        self.assertEqual(Product.delete_by_id(product_id), 1)
+        self.assertEqual(len(Product.all()), 0)
+        self.assertEqual(Product.delete_by_id(product_id), 0)
+
     def test_list_all_products(self):
         """It should List all Products from the database"""
         products = Product.all()
         self.assertEqual(len(products), 0)
 
-        for _ in range(1, 6):
-            product = ProductFactory()
-            product.Id = None
-            product.create()
+        created = self._create_products(5)
 
         products = Product.all()
         self.assertEqual(len(products), 5)
+        self.assertEqual(sorted(product.id for product in created), sorted(product.id for product in products))
 
     def test_find_product_by_name(self):
         """It should Find Products by Name from the database"""
-        for _ in range(1, 6):
-            product = ProductFactory()
-            product.Id = None
-            product.create()
+        self._create_products(5)
 
         products = Product.all()
         first_product = products[0]
@@ -193,7 +210,7 @@ class TestProductModel(unittest.TestCase):
             if first_product.name == products[i].name:
                 occurrences += 1
 
-        products_with_same_name = product.find_by_name(first_product.name)
+        products_with_same_name = Product.find_by_name(first_product.name)
         self.assertEqual(products_with_same_name.count(), occurrences)
 
         for i in range(0, products_with_same_name.count()):
@@ -201,10 +218,7 @@ class TestProductModel(unittest.TestCase):
 
     def test_find_product_by_availability(self):
         """It should Find Products by Availability from the database"""
-        for _ in range(1, 11):
-            product = ProductFactory()
-            product.Id = None
-            product.create()
+        self._create_products(10)
 
         products = Product.all()
         first_product = products[0]
@@ -214,7 +228,7 @@ class TestProductModel(unittest.TestCase):
             if first_product.available == products[i].available:
                 occurrences += 1
 
-        products_with_same_availability = product.find_by_availability(first_product.available)
+        products_with_same_availability = Product.find_by_availability(first_product.available)
         self.assertEqual(products_with_same_availability.count(), occurrences)
 
         for i in range(0, products_with_same_availability.count()):
@@ -222,10 +236,7 @@ class TestProductModel(unittest.TestCase):
 
     def test_find_product_by_category(self):
         """It should Find Products by Category from the database"""
-        for _ in range(1, 11):
-            product = ProductFactory()
-            product.Id = None
-            product.create()
+        self._create_products(10)
 
         products = Product.all()
         first_product = products[0]
@@ -235,12 +246,49 @@ class TestProductModel(unittest.TestCase):
             if first_product.category == products[i].category:
                 occurrences += 1
 
-        products_with_same_category = product.find_by_category(first_product.category)
+        products_with_same_category = Product.find_by_category(first_product.category)
         self.assertEqual(products_with_same_category.count(), occurrences)
 
         for i in range(0, products_with_same_category.count()):
             self.assertEqual(products_with_same_category[i].category, first_product.category)
 
+    def test_serialize_bytes(self):
+        """It should Serialize a Product to cached JSON bytes"""
+        product = ProductFactory()
+        product.id = None
+        product.create()
+
+        data = product.serialize_bytes()
+        self.assertEqual(json.loads(data), product.serialize())
+        self.assertIs(product.serialize_bytes(), data)
+
+        new_data = product.serialize()
+        new_data["name"] = "Fedora"
+        product.deserialize(new_data)
+        self.assertEqual(json.loads(product.serialize_bytes())["name"], "Fedora")
+
+        product.description = "A red hat"
+        self.assertEqual(json.loads(product.serialize_bytes())["description"], "A red hat")
+
+        product.update()
+        db_product = Product.find(product.id)
+        self.assertEqual(json.loads(db_product.serialize_bytes())["name"], "Fedora")
+
+        # change the row behind the session's back, then reload it
+        with db.engine.begin() as connection:
+            connection.execute(
+                db.update(Product).where(Product.id == db_product.id).values(name="Bowler")
+            )
+        db.session.commit()
+        self.assertEqual(json.loads(db_product.serialize_bytes())["name"], "Bowler")
+
+        with db.engine.begin() as connection:
+            connection.execute(
+                db.update(Product).where(Product.id == db_product.id).values(name="Beret")
+            )
+        db.session.refresh(db_product)
+        self.assertEqual(json.loads(db_product.serialize_bytes())["name"], "Beret")
+
     def test_invalid_available_data_type_in_deserialize_(self):
         """It should throw exception for invalid available data type"""
         product = ProductFactory()
@@ -253,10 +301,7 @@ class TestProductModel(unittest.TestCase):
 
     def test_find_product_by_price(self):
         """It should Find Products by Price from the database"""
-        for _ in range(1, 11):
-            product = ProductFactory()
-            product.Id = None
-            product.create()
+        self._create_products(10)
 
         products = Product.all()
         first_product = products[0]
@@ -266,7 +311,7 @@ class TestProductModel(unittest.TestCase):
             if first_product.price == products[i].price:
                 occurrences += 1
 
-        products_with_same_price = product.find_by_price(first_product.price)
+        products_with_same_price = Product.find_by_price(first_product.price)
         self.assertEqual(products_with_same_price.count(), occurrences)
 
         for i in range(0, products_with_same_price.count()):
@@ -274,10 +319,7 @@ class TestProductModel(unittest.TestCase):
 
     def test_find_product_by_price_string(self):
         """It should Find Products by Price string from the database"""
-        for _ in range(1, 11):
-            product = ProductFactory()
-            product.Id = None
-            product.create()
+        self._create_products(10)
 
         products = Product.all()
         first_product = products[0]
@@ -287,7 +329,7 @@ class TestProductModel(unittest.TestCase):
             if first_product.price == products[i].price:
                 occurrences += 1
 
-        products_with_same_price = product.find_by_price(str(first_product.price))
+        products_with_same_price = Product.find_by_price(str(first_product.price))
         self.assertEqual(products_with_same_price.count(), occurrences)
 
         for i in range(0, products_with_same_price.count()):
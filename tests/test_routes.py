@@ -26,12 +26,16 @@ Test cases can be run with the following:
 """
 import os
 import logging
+import threading
 from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import patch
 from urllib.parse import quote_plus
 from service import app
 from service.common import status
 from service.models import db, init_db, Product
+from service.routes import product_cache, MAX_PER_PAGE
+from service.routes import _product_reads, _product_generations
 from tests.factories import ProductFactory
 
 # Disable all but critical errors during normal test run
@@ -72,6 +76,7 @@ class TestProductRoutes(TestCase):
         self.client = app.test_client()
         db.session.query(Product).delete()  # clean up the last tests
         db.session.commit()
+        product_cache.clear()
 
     def tearDown(self):
         db.session.remove()
@@ -160,6 +165,14 @@ class TestProductRoutes(TestCase):
         response = self.client.post(BASE_URL, data={}, content_type="plain/text")
         self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
 
+    def test_create_product_content_type_with_charset(self):
+        """It should Create a Product when the Content-Type has a charset"""
+        test_product = ProductFactory()
+        response = self.client.post(
+            BASE_URL, json=test_product.serialize(), content_type="application/json; charset=utf-8"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     #
     # ADD YOUR TEST CASES HERE
     #
@@ -181,11 +194,38 @@ class TestProductRoutes(TestCase):
         self.assertEqual(product["available"], test_product.available)
         self.assertEqual(product["category"], test_product.category.name)
 
+    def test_get_product_not_modified(self):
+        """It should return Not Modified for a Product the client already has"""
+        test_product = self._create_products()[0]
+        location = BASE_URL + "/" + str(test_product.id)
+        response = self.client.get(location)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+
+        response = self.client.get(location, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(b"", response.data)
+
+        new_product = test_product.serialize()
+        new_product["name"] = "Test Name"
+        response = self.client.put(location, json=new_product)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(location, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers.get("ETag"), etag)
+
     def test_get_product_not_found(self):
         """It should not find Product by its Id"""
         response = self.client.get(BASE_URL + "/1")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_get_product_invalid_id(self):
+        """It should not find a Product with an Id that is not an integer"""
+        response = self.client.get(BASE_URL + "/abc")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     # ----------------------------------------------------------
     # TEST UPDATE
     # ----------------------------------------------------------
@@ -205,6 +245,22 @@ class TestProductRoutes(TestCase):
         product = response.get_json()
         self.assertEqual(product["name"], "Test Name")
 
+    def test_update_product_refreshes_cache(self):
+        """It should not Get a stale Product after an Update"""
+        test_product = self._create_products()[0]
+        location = BASE_URL + "/" + str(test_product.id)
+        response = self.client.get(location)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        new_product = response.get_json()
+        new_product["name"] = "Test Name"
+        response = self.client.put(location, json=new_product)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(location)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.get_json()["name"], "Test Name")
+
     # ----------------------------------------------------------
     # TEST DELETE
     # ----------------------------------------------------------
@@ -225,6 +281,54 @@ class TestProductRoutes(TestCase):
         product_final_count = self.get_product_count()
         self.assertEqual(product_final_count, product_count - 1)
 
+    def test_delete_product_not_found(self):
+        """It should not Delete a Product that is not found"""
+        response = self.client.delete(BASE_URL + "/0")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_delete_product_during_get(self):
+        """It should not cache a Product read while it is being Deleted"""
+        test_product = self._create_products()[0]
+        location = BASE_URL + "/" + str(test_product.id)
+        found = threading.Event()
+        deleted = threading.Event()
+        find = Product.find
+
+        def find_then_wait(product_id):
+            product = find(product_id)
+            product.serialize()  # load the row before the delete
+            found.set()
+            deleted.wait(5)
+            return product
+
+        responses = []
+        with patch.object(Product, "find", find_then_wait):
+            reader = threading.Thread(target=lambda: responses.append(app.test_client().get(location)))
+            reader.start()
+            self.assertTrue(found.wait(5))
+            response = self.client.delete(location)
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+            deleted.set()
+            reader.join(5)
+
+        self.assertEqual(responses[0].status_code, status.HTTP_200_OK)
+        response = self.client.get(location)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(_product_reads, {})
+        self.assertEqual(_product_generations, {})
+
+    def test_cache_bookkeeping_is_released(self):
+        """It should not keep cache bookkeeping once no reads are in flight"""
+        products = self._create_products(3)
+        for product in products:
+            location = BASE_URL + "/" + str(product.id)
+            self.assertEqual(self.client.get(location).status_code, status.HTTP_200_OK)
+            self.assertEqual(self.client.delete(location).status_code, status.HTTP_204_NO_CONTENT)
+            self.assertEqual(self.client.get(location).status_code, status.HTTP_404_NOT_FOUND)
+
+        self.assertEqual(_product_reads, {})
+        self.assertEqual(_product_generations, {})
+
     # ----------------------------------------------------------
     # TEST LIST
     # ----------------------------------------------------------
@@ -239,6 +343,55 @@ class TestProductRoutes(TestCase):
         data = response.get_json()
         self.assertEqual(len(data), 5)
 
+    def test_get_product_list_page(self):
+        """It should Get a page of Products"""
+        products = self._create_products(5)
+
+        response = self.client.get(BASE_URL, query_string="page=2&per_page=2")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.get_json()
+        self.assertEqual([product["id"] for product in data], [products[2].id, products[3].id])
+
+        response = self.client.get(BASE_URL, query_string="page=3&per_page=2")
+        self.assertEqual(len(response.get_json()), 1)
+
+    def test_get_product_list_first_page(self):
+        """It should Get the first page of Products given only per_page"""
+        products = self._create_products(3)
+
+        response = self.client.get(BASE_URL, query_string="per_page=2")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.get_json()
+        self.assertEqual([product["id"] for product in data], [products[0].id, products[1].id])
+
+    def test_get_product_list_bad_page(self):
+        """It should not Get a page of Products with an invalid page or per_page"""
+        for query_string in ("page=0", "page=abc", "per_page=abc", "page=1&per_page=0",
+                             f"page=1&per_page={MAX_PER_PAGE + 1}", "count_only=1&page=abc",
+                             "count_only=true&per_page=0"):
+            response = self.client.get(BASE_URL, query_string=query_string)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query_string)
+
+    def test_count_products(self):
+        """It should Count the Products"""
+        products = self._create_products(5)
+        available_count = len([product for product in products if product.available])
+
+        response = self.client.get(BASE_URL, query_string="count_only=true")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.get_json(), {"count": 5})
+
+        response = self.client.get(BASE_URL, query_string="available=true&count_only=1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.get_json(), {"count": available_count})
+
+    def test_count_products_bad_flag(self):
+        """It should not Count the Products with an invalid count_only flag"""
+        response = self.client.get(BASE_URL, query_string="count_only=maybe")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_query_by_name(self):
         """It should Query Products by name"""
         products = self._create_products(5)
@@ -283,6 +436,11 @@ class TestProductRoutes(TestCase):
         for product in data:
             self.assertEqual(product["category"], category.name)
 
+    def test_query_by_unknown_category(self):
+        """It should not Query Products by an unknown category"""
+        response = self.client.get(BASE_URL, query_string="category=spaceships")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_query_by_availability(self):
         """It should Query Products by availability"""
         products = self._create_products(10)
@@ -307,11 +465,10 @@ class TestProductRoutes(TestCase):
             self.assertTrue(product["available"])
 
     def test_query_by_availability_exception(self):
-        """It should Query Products by availability and throw exception"""
-        with self.assertRaises(ValueError) as context:
-            _ = self.client.get(BASE_URL + "?available=truuue")
-
-        self.assertEqual(str(context.exception), "Cannot convert truuue to a boolean")
+        """It should not Query Products by an invalid availability"""
+        response = self.client.get(BASE_URL + "?available=truuue")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Cannot convert truuue to a boolean", response.get_json()["message"])
 
     ######################################################################
     # Utility functions